@@ -1,11 +1,15 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 from datetime import datetime
 import os
+import time
 import sys
 import base64
+import hashlib
 import requests
-from io import StringIO
+from requests.adapters import HTTPAdapter
+from io import BytesIO
 
 # --- CONFIG -----------------------------------------------------------------
 COLUMNS = [
@@ -16,75 +20,291 @@ COLUMNS = [
     "BALANCE AS OF TODAY",
     "STATUS"
 ]
+STATUS_CLEARED = "Cleared ✅"
+STATUS_PENDING = "Pending ⏳"
+SYNC_INTERVAL = 30  # seconds between automatic GitHub pushes of batched edits
+PAGE_SIZE = 50  # rows sent to the table editor per page
+SEARCH_LIMIT = 10  # type-ahead matches shown on the Update page
 
 # --- GITHUB CONFIG ----------------------------------------------------------
-GITHUB_TOKEN = st.secrets["GITHUB_TOKEN"]
-REPO_NAME = st.secrets["REPO_NAME"]
-FILE_PATH = st.secrets["FILE_PATH"]
-API_URL = f"https://api.github.com/repos/{REPO_NAME}/contents/{FILE_PATH}"
-HEADERS = {"Authorization": f"token {GITHUB_TOKEN}"}
+@st.cache_resource
+def gh_config():
+    """(session, api_url, file_path), built once per process rather than on every rerun.
+
+    The session keeps one pooled keep-alive connection to api.github.com instead of
+    a new TLS handshake per call.
+    """
+    session = requests.Session()
+    session.headers.update({"Authorization": f"token {st.secrets['GITHUB_TOKEN']}"})
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    file_path = st.secrets["FILE_PATH"]
+    api_url = f"https://api.github.com/repos/{st.secrets['REPO_NAME']}/contents/{file_path}"
+    return session, api_url, file_path
+
+
+CONFLICT_MESSAGE = (
+    "❌ The file on GitHub was changed by someone else since you loaded it. "
+    "Use 🔄 Reload from GitHub to get their changes, then re-enter your unsynced edits."
+)
+
+
+def use_parquet(file_path):
+    # Point FILE_PATH at a .parquet file to store the table columnar + zstd instead of CSV
+    return file_path.endswith(".parquet")
 
 
 # --- GITHUB HELPERS ---------------------------------------------------------
-def github_load_csv():
-    """Fetch CSV from GitHub repo (via API). If missing, return empty DataFrame."""
-    res = requests.get(API_URL, headers=HEADERS)
+@st.cache_data(ttl=30, show_spinner=False)
+def _github_fetch(url):
+    """GET a Contents API entry. Returns the JSON body, or None if missing."""
+    session, _, _ = gh_config()
+    res = session.get(url)
     if res.status_code == 200:
-        content = base64.b64decode(res.json()["content"]).decode()
-        df = pd.read_csv(StringIO(content))
-        return df
+        return res.json()
+    return None
+
+
+def github_load_csv():
+    """Fetch CSV (or Parquet) from GitHub repo (via API) as (df, sha, digest).
+
+    digest is the SHA-256 of the downloaded bytes, so a save that would write them
+    back unchanged can be skipped. If missing, returns an empty DataFrame and Nones.
+    """
+    _, api_url, file_path = gh_config()
+    data = _github_fetch(api_url)
+    if data is not None:
+        content = base64.b64decode(data["content"])
+        digest = hashlib.sha256(content).digest()
+        raw = BytesIO(content)
+        if use_parquet(file_path):
+            df = pd.read_parquet(raw)
+        else:
+            # Keep DATE as text; pyarrow would otherwise infer timestamps
+            df = pd.read_csv(raw, engine="pyarrow", dtype={"DATE": str})
+        return df, data["sha"], digest
     else:
         # File not found or empty repo
-        return pd.DataFrame(columns=COLUMNS)
+        return pd.DataFrame(columns=COLUMNS), None, None
 
 
 def github_save_csv(df):
-    """Save CSV back to GitHub (create or update file)."""
+    """Save CSV (or Parquet) back to GitHub (create or update file). Returns True on success."""
+    if st.session_state.get("sync_conflict"):
+        # The sidebar already shows CONFLICT_MESSAGE
+        return False
+    session, api_url, file_path = gh_config()
     df = df.reindex(columns=COLUMNS)
-    csv_content = df.to_csv(index=False)
-    encoded = base64.b64encode(csv_content.encode()).decode()
-
-    # Check if file exists (to include its SHA for update)
-    get_res = requests.get(API_URL, headers=HEADERS)
-    if get_res.status_code == 200:
-        sha = get_res.json()["sha"]
+    buf = BytesIO()
+    if use_parquet(file_path):
+        df.to_parquet(buf, index=False, compression="zstd")
     else:
-        sha = None
+        df.to_csv(buf, index=False)
+
+    # Nothing changed since our last push -> no commit, no network
+    digest = hashlib.sha256(buf.getbuffer()).digest()
+    if st.session_state.get("last_digest") == digest:
+        st.info("No changes to save.")
+        return True
+    encoded = base64.b64encode(buf.getvalue()).decode("ascii")
+
+    # SHA of the version this session's DataFrame is based on (from its load or our
+    # last PUT). Never refetch it here: a newer SHA would let a stale table overwrite it.
+    sha = st.session_state.get("csv_sha")
 
     payload = {
-        "message": "Update customers.csv from Streamlit app",
+        "message": f"Update {file_path} from Streamlit app",
         "content": encoded,
         "sha": sha
     }
-    put_res = requests.put(API_URL, headers=HEADERS, json=payload)
-    if put_res.status_code not in (200, 201):
+    put_res = session.put(api_url, json=payload)
+    # 422 with no SHA: the file was created elsewhere after we saw it missing
+    if put_res.status_code == 409 or (put_res.status_code == 422 and sha is None):
+        # Someone else pushed since we loaded. Retrying with a fresh SHA would
+        # overwrite their rows with ours, so block saves until the user reloads.
+        # Rerun so the sidebar (drawn before any save) shows the conflict and
+        # enables Reload right away.
+        st.session_state["sync_conflict"] = True
+        st.rerun(scope="app")
+    elif put_res.status_code not in (200, 201):
         st.error(f"❌ GitHub save failed: {put_res.status_code} {put_res.text}")
+        return False
     else:
+        st.session_state["csv_sha"] = put_res.json()["content"]["sha"]
+        st.session_state["last_digest"] = digest
+        _github_fetch.clear()
+        load_data.clear()
         st.success("✅ Saved to GitHub successfully.")
+        return True
 
 
 # --- STATUS COMPUTE ---------------------------------------------------------
 def compute_status(balance):
-    return "Cleared ✅" if float(balance) <= 0 else "Pending ⏳"
+    return STATUS_CLEARED if float(balance) <= 0 else STATUS_PENDING
+
+
+def compute_status_column(balances):
+    """Vectorized compute_status for a whole balance column."""
+    return as_status(np.where(balances.to_numpy() <= 0, STATUS_CLEARED, STATUS_PENDING))
+
+
+def as_status(values):
+    """STATUS as a two-value categorical; anything unrecognised becomes NaN."""
+    categories = [STATUS_CLEARED, STATUS_PENDING]
+    # Mask unknowns ourselves: pandas is deprecating silent coercion of values
+    # outside the categories to NaN
+    values = pd.Series(values, copy=False)
+    return pd.Categorical(values.where(values.isin(categories)), categories=categories)
+
+
+def recompute_balances(df):
+    """Rebuild BALANCE AS OF TODAY and STATUS from owed - paid, discarding manual overrides."""
+    df["BALANCE AS OF TODAY"] = (df["AMOUNT OWED"] - df["BALANCE PAID"]).clip(lower=0.0)
+    df["STATUS"] = compute_status_column(df["BALANCE AS OF TODAY"])
 
 
 # --- BUSINESS LOGIC ---------------------------------------------------------
+def _now_str():
+    """Current time as "YYYY-MM-DD HH:MM:SS" (same as the old strftime, without the format parse)."""
+    return datetime.now().isoformat(sep=" ", timespec="seconds")
+
+
+@st.cache_data(ttl=60, show_spinner=False)
 def load_data():
-    df = github_load_csv()
-    for col in ["AMOUNT OWED", "BALANCE PAID", "BALANCE AS OF TODAY"]:
-        df[col] = pd.to_numeric(df.get(col, 0.0), errors="coerce").fillna(0.0)
-    df["BALANCE AS OF TODAY"] = (df["AMOUNT OWED"] - df["BALANCE PAID"]).clip(lower=0.0)
-    df["STATUS"] = df["BALANCE AS OF TODAY"].apply(compute_status)
-    return df
+    """(df, sha, digest): the normalised customer table, the GitHub SHA it was read at,
+    and the SHA-256 of the downloaded bytes."""
+    df, sha, digest = github_load_csv()
+    df = df.reindex(columns=COLUMNS)
+    # Money stays float64: float32 rounds above 2**24 and round-trips to CSV as 8.1915e+06
+    for col in ["AMOUNT OWED", "BALANCE PAID"]:
+        df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0.0)
+    df["CUSTOMER NAME"] = df["CUSTOMER NAME"].astype("string[pyarrow]")
+
+    # The stored balance/status are authoritative (they may hold manual overrides);
+    # only fill in rows where they are missing or unreadable.
+    df["BALANCE AS OF TODAY"] = pd.to_numeric(df["BALANCE AS OF TODAY"], errors="coerce")
+    df["STATUS"] = as_status(df["STATUS"])
+    missing_balance = df["BALANCE AS OF TODAY"].isna()
+    if missing_balance.any():
+        computed = (df["AMOUNT OWED"] - df["BALANCE PAID"]).clip(lower=0.0)
+        df.loc[missing_balance, "BALANCE AS OF TODAY"] = computed[missing_balance]
+    missing_status = df["STATUS"].isna() | missing_balance
+    if missing_status.any():
+        df.loc[missing_status, "STATUS"] = compute_status_column(
+            df.loc[missing_status, "BALANCE AS OF TODAY"]
+        )
+    # Rows are labelled by customer name so lookups are a hashed Index probe. Labels
+    # must be unique for .at/.loc, so repeats in the file get "Name (2)" labels; the
+    # CUSTOMER NAME column itself is left untouched and is what gets saved.
+    labels = df["CUSTOMER NAME"].astype(object).fillna("(unnamed)")
+    dup = labels.duplicated()
+    if dup.any():
+        n = labels[dup].groupby(labels[dup]).cumcount() + 2
+        labels[dup] = labels[dup] + " (" + n.astype(str) + ")"
+        st.warning(f"{int(dup.sum())} duplicate customer name(s) in the file; extra rows are listed as 'Name (2)', ...")
+    # Bare values: an Index built from the Series would inherit its "CUSTOMER NAME" name
+    df.index = pd.Index(labels.to_numpy())
+    return df, sha, digest
+
+
+def get_df():
+    """Working DataFrame for this session. Loaded once, then mutated in place."""
+    if "df" not in st.session_state:
+        df, st.session_state["csv_sha"], st.session_state["last_digest"] = load_data()
+        st.session_state["df"] = df
+    return st.session_state["df"]
+
+
+def get_name_options():
+    """Selectbox options ("" + every customer name), cached until the names change."""
+    if "names" not in st.session_state:
+        st.session_state["names"] = [""] + get_df().index.tolist()
+    return st.session_state["names"]
+
+
+def get_name_prefixes():
+    """Token-prefix index: every prefix of every lower-cased name token -> set of names."""
+    if "name_prefixes" not in st.session_state:
+        prefixes = {}
+        for name in get_df().index:
+            if not isinstance(name, str):
+                continue
+            for token in set(name.lower().split()):
+                for i in range(1, len(token) + 1):
+                    prefixes.setdefault(token[:i], set()).add(name)
+        st.session_state["name_prefixes"] = prefixes
+    return st.session_state["name_prefixes"]
+
+
+def search_names(query, limit=SEARCH_LIMIT):
+    """Names where every query token prefixes some name token, e.g. "mu ka" -> "Mukasa Kato"."""
+    prefixes = get_name_prefixes()
+    hits = None
+    for token in query.lower().split():
+        posting = prefixes.get(token, set())
+        hits = posting if hits is None else hits & posting
+        if not hits:
+            return []
+    return sorted(hits)[:limit] if hits else []
+
+
+def _invalidate_indexes():
+    st.session_state.pop("names", None)
+    st.session_state.pop("name_prefixes", None)
+
+
+def set_df(df):
+    """Replace the session DataFrame and drop anything derived from it."""
+    st.session_state["df"] = df
+    _invalidate_indexes()
+
+
+def refresh_df():
+    """Drop the in-memory copy so the next get_df() pulls fresh data from GitHub."""
+    st.session_state.pop("df", None)
+    st.session_state.pop("csv_sha", None)
+    st.session_state.pop("last_digest", None)
+    _invalidate_indexes()
+    _github_fetch.clear()
+    load_data.clear()
+    st.session_state["dirty"] = False
+    st.session_state["sync_conflict"] = False
+
+
+def flush():
+    """Push the session DataFrame to GitHub if it has unsynced changes."""
+    if not st.session_state.get("dirty"):
+        return True
+    if not github_save_csv(get_df()):
+        return False
+    st.session_state["dirty"] = False
+    st.session_state["last_sync"] = time.time()
+    return True
+
+
+def maybe_autoflush():
+    """Flush batched changes once SYNC_INTERVAL has passed since the last push."""
+    last_sync = st.session_state.setdefault("last_sync", time.time())
+    if (st.session_state.get("dirty") and not st.session_state.get("sync_conflict")
+            and time.time() - last_sync > SYNC_INTERVAL):
+        flush()
+
+
+def mark_dirty():
+    """Record an in-memory change; it reaches GitHub on the next sync.
+
+    Doesn't flush itself: the maybe_autoflush() at the end of the full-app run does,
+    so save messages aren't wiped by the st.rerun() that follows fragment mutations.
+    """
+    st.session_state["dirty"] = True
 
 
 def add_new_customer(name, amount_owed, payment_now):
-    df = load_data()
+    df = get_df()
     key = name.strip().title()
     if not key:
         st.warning("Enter customer name.")
         return
-    if key in df["CUSTOMER NAME"].values:
+    if key in df.index:
         st.warning(f"Customer '{key}' already exists. Use Update to add payment.")
         return
 
@@ -92,41 +312,95 @@ def add_new_customer(name, amount_owed, payment_now):
     balance_as_of_today = max(float(amount_owed) - balance_paid, 0.0)
     status = compute_status(balance_as_of_today)
     new = {
-        "DATE": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "DATE": _now_str(),
         "CUSTOMER NAME": key,
         "AMOUNT OWED": float(amount_owed),
         "BALANCE PAID": balance_paid,
         "BALANCE AS OF TODAY": balance_as_of_today,
         "STATUS": status
     }
-    df = pd.concat([df, pd.DataFrame([new])], ignore_index=True)
-    github_save_csv(df)
+    df.loc[key] = new
+    # Row enlargement falls back to object dtype; restore the compact ones
+    df["CUSTOMER NAME"] = df["CUSTOMER NAME"].astype("string[pyarrow]")
+    df["STATUS"] = as_status(df["STATUS"])
+    _invalidate_indexes()
+    mark_dirty()
     st.success(f"Added customer '{key}' (balance {balance_as_of_today:.2f})")
 
 
 def update_customer_add_payment(name, payment_now, set_balance_manual):
-    df = load_data()
-    key = name.strip().title()
-    if key not in df["CUSTOMER NAME"].values:
+    df = get_df()
+    # Row labels from the selectbox ("(unnamed)", "Name (2)") are used as-is;
+    # only free-typed names need normalising
+    key = name if name in df.index else name.strip().title()
+    try:
+        df.index.get_loc(key)
+    except KeyError:
         st.error("Customer not found.")
         return
-    idx = df.index[df["CUSTOMER NAME"] == key][0]
 
-    prev_paid = float(df.at[idx, "BALANCE PAID"])
+    prev_paid = float(df.at[key, "BALANCE PAID"])
     new_paid = prev_paid + float(payment_now)
-    df.at[idx, "BALANCE PAID"] = new_paid
 
-    computed_balance = max(float(df.at[idx, "AMOUNT OWED"]) - new_paid, 0.0)
+    computed_balance = max(float(df.at[key, "AMOUNT OWED"]) - new_paid, 0.0)
     if set_balance_manual is None:
-        df.at[idx, "BALANCE AS OF TODAY"] = computed_balance
+        balance = computed_balance
     else:
-        df.at[idx, "BALANCE AS OF TODAY"] = max(float(set_balance_manual), 0.0)
+        balance = max(float(set_balance_manual), 0.0)
+
+    now = _now_str()
+    df.loc[key, ["BALANCE PAID", "BALANCE AS OF TODAY", "DATE", "STATUS"]] = [
+        new_paid, balance, now, compute_status(balance)
+    ]
 
-    df.at[idx, "DATE"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    df.at[idx, "STATUS"] = compute_status(df.at[idx, "BALANCE AS OF TODAY"])
+    mark_dirty()
+    # Shown by the Update page after the full-app rerun that follows this call
+    st.session_state["flash"] = f"Updated '{key}': paid {payment_now:.2f}, balance {balance:.2f}"
+    return True
 
-    github_save_csv(df)
-    st.success(f"Updated '{key}': paid {payment_now:.2f}, balance {df.at[idx, 'BALANCE AS OF TODAY']:.2f}")
+
+# --- UI PANELS --------------------------------------------------------------
+def _pick_customer(name):
+    st.session_state["selected_customer"] = name
+
+
+@st.fragment
+def customer_update_panel():
+    """Select + update form. Runs as a fragment so picking a customer only reruns this block."""
+    df = get_df()
+    if "flash" in st.session_state:
+        st.success(st.session_state.pop("flash"))
+    query = st.text_input("Search customer", placeholder="Type part of a name")
+    if query:
+        matches = search_names(query)
+        if not matches:
+            st.caption("No matches.")
+        for name in matches:
+            st.button(name, key=f"pick_{name}", on_click=_pick_customer, args=(name,))
+    selected = st.selectbox("Select customer", get_name_options(), key="selected_customer")
+    if selected:
+        st.write(f"**Total owed:** {df.at[selected,'AMOUNT OWED']:.2f}")
+        st.write(f"**Balance paid so far:** {df.at[selected,'BALANCE PAID']:.2f}")
+        st.write(f"**Balance as of today:** {df.at[selected,'BALANCE AS OF TODAY']:.2f}")
+        st.write(f"**Status:** {df.at[selected,'STATUS']}")
+        st.markdown("---")
+        with st.form("update_form"):
+            payment_now = st.number_input("Payment Now (UGX)", min_value=0.0, step=100.0, format="%.2f")
+            manual_balance = st.number_input("Manual Balance Override (optional)", min_value=0.0, step=100.0, format="%.2f", value=0.0)
+            if st.form_submit_button("Apply Payment / Update"):
+                override = manual_balance if manual_balance != 0 else None
+                if update_customer_add_payment(selected, payment_now, override):
+                    # A fragment rerun leaves the sidebar's unsynced warning and Reload
+                    # button stale; rerun the whole app so they reflect the new payment
+                    st.rerun(scope="app")
+
+
+def _jump_to_customer():
+    """on_change for the table search box: move the pager to that customer's page."""
+    key = st.session_state["table_search"].strip().title()
+    df = get_df()
+    if key in df.index:
+        st.session_state["table_page"] = df.index.get_loc(key) // PAGE_SIZE
 
 
 # --- APP UI -----------------------------------------------------------------
@@ -134,6 +408,13 @@ st.set_page_config(page_title="Customer Balance Tracker", page_icon="💰", layo
 st.title("💰 Customer Balance Tracker (GitHub Synced)")
 
 menu = st.sidebar.selectbox("Menu", ["Add New Customer", "Update Customer", "View / Edit Table", "Debug Info"])
+st.session_state.setdefault("dirty", False)
+st.session_state.setdefault("sync_conflict", False)
+# While dirty, reloading would discard edits; allow it only once a conflict makes syncing impossible
+if st.sidebar.button("🔄 Reload from GitHub",
+                     disabled=st.session_state["dirty"] and not st.session_state["sync_conflict"],
+                     help="Sync pending changes first."):
+    refresh_df()
 
 if menu == "Add New Customer":
     st.header("Add New Customer")
@@ -146,37 +427,38 @@ if menu == "Add New Customer":
 
 elif menu == "Update Customer":
     st.header("Record Payment / Update")
-    df = load_data()
+    df = get_df()
     if df.empty:
         st.info("No customers found.")
     else:
-        names = df["CUSTOMER NAME"].tolist()
-        selected = st.selectbox("Select customer", [""] + names)
-        if selected:
-            idx = df.index[df["CUSTOMER NAME"] == selected][0]
-            st.write(f"**Total owed:** {df.at[idx,'AMOUNT OWED']:.2f}")
-            st.write(f"**Balance paid so far:** {df.at[idx,'BALANCE PAID']:.2f}")
-            st.write(f"**Balance as of today:** {df.at[idx,'BALANCE AS OF TODAY']:.2f}")
-            st.write(f"**Status:** {df.at[idx,'STATUS']}")
-            st.markdown("---")
-            with st.form("update_form"):
-                payment_now = st.number_input("Payment Now (UGX)", min_value=0.0, step=100.0, format="%.2f")
-                manual_balance = st.number_input("Manual Balance Override (optional)", min_value=0.0, step=100.0, format="%.2f", value=0.0)
-                if st.form_submit_button("Apply Payment / Update"):
-                    override = manual_balance if manual_balance != 0 else None
-                    update_customer_add_payment(selected, payment_now, override)
+        customer_update_panel()
 
 elif menu == "View / Edit Table":
     st.header("Customer Records (Editable)")
-    df = load_data()
+    df = get_df()
     if df.empty:
         st.info("No records.")
     else:
+        last_page = (len(df) - 1) // PAGE_SIZE
+        if st.session_state.get("table_page", 0) > last_page:
+            st.session_state["table_page"] = last_page
+        search = st.text_input("Jump to customer", key="table_search", on_change=_jump_to_customer)
+        if search and search.strip().title() not in df.index:
+            st.caption(f"No customer named '{search.strip().title()}'.")
+        page = st.number_input("Page", min_value=0, max_value=last_page, step=1, key="table_page")
+        start = page * PAGE_SIZE
+        page_df = df.iloc[start:start + PAGE_SIZE]
+        st.caption(f"Rows {start + 1}–{start + len(page_df)} of {len(df)}")
+
+        # Range index so hide_index works with dynamic rows; the row label rides along
+        # in a hidden "_row" column so edits map back even for duplicate names
         edited = st.data_editor(
-            df,
+            page_df.rename_axis("_row").reset_index(),
             num_rows="dynamic",
             use_container_width=True,
+            hide_index=True,
             column_config={
+                "_row": None,
                 "BALANCE AS OF TODAY": st.column_config.NumberColumn(
                     "BALANCE AS OF TODAY (editable)", min_value=0.0, format="%.2f"
                 )
@@ -184,14 +466,38 @@ elif menu == "View / Edit Table":
             disabled=["DATE", "CUSTOMER NAME", "AMOUNT OWED", "BALANCE PAID", "STATUS"]
         )
         if st.button("Save Edits"):
-            edited["BALANCE AS OF TODAY"] = edited["BALANCE AS OF TODAY"].clip(lower=0.0)
-            edited["STATUS"] = edited["BALANCE AS OF TODAY"].apply(compute_status)
-            github_save_csv(edited)
+            # Merge the edited page back; rows added in the editor have no name and are ignored
+            edited = edited.dropna(subset=["_row"]).set_index("_row").rename_axis(None)
+            kept = edited.loc[edited.index.intersection(page_df.index)]
+            df.update(kept[["BALANCE AS OF TODAY"]].clip(lower=0.0))
+            df.loc[kept.index, "STATUS"] = compute_status_column(df.loc[kept.index, "BALANCE AS OF TODAY"])
+            removed = page_df.index.difference(edited.index)
+            if len(removed):
+                set_df(df.drop(removed))
+            # Explicit save: push once now rather than waiting for the autoflush
+            st.session_state["dirty"] = True
+            flush()
+        if st.button("Recompute Balances", help="Reset every balance to owed - paid. Clears manual overrides."):
+            recompute_balances(df)
+            mark_dirty()
+            st.rerun()
 
 elif menu == "Debug Info":
     st.header("Debug Info")
     st.write(f"Python: {sys.version}")
-    st.write(f"Repo: {REPO_NAME}")
-    st.write(f"File Path: {FILE_PATH}")
-    df = load_data()
-    st.dataframe(df.head(10))
+    st.write(f"Repo: {st.secrets['REPO_NAME']}")
+    st.write(f"File Path: {st.secrets['FILE_PATH']}")
+    df = get_df()
+    st.dataframe(df.head(10), hide_index=True)
+
+# --- SYNC -------------------------------------------------------------------
+maybe_autoflush()
+with st.sidebar:
+    st.markdown("---")
+    if st.button("⬆️ Sync to GitHub"):
+        flush()
+    if st.session_state["sync_conflict"]:
+        st.error(CONFLICT_MESSAGE)
+    elif st.session_state["dirty"]:
+        st.warning("Unsynced changes. They are pushed on the next action after "
+                   f"{SYNC_INTERVAL}s, or when you click Sync.")